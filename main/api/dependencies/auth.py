@@ -9,15 +9,15 @@ from main.api.dependencies.database import get_database_session
 from main.api.exception import ForbiddenException, UnauthorizedException
 from main.models.category import CategoryModel
 from main.models.item import ItemModel
-from main.models.user import UserModel
+from main.schemas.user import UserPrincipalSchema
 from main.services.auth import decode_access_token
-from main.services.user import get_user_by_id
+from main.services.user import get_user_principal_by_id
 
 
 async def require_authenticated_user(
     session: AsyncSession = Depends(get_database_session),
     http_credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
-) -> UserModel:
+) -> UserPrincipalSchema:
     if http_credentials is None:
         raise UnauthorizedException()
 
@@ -31,20 +31,24 @@ async def require_authenticated_user(
     if user_id is None:
         raise UnauthorizedException()
 
-    user = await get_user_by_id(session, user_id)
+    user = await get_user_principal_by_id(session, user_id)
     if user is None:
         raise UnauthorizedException()
 
     return user
 
 
+def ensure_ownership(resource: Union[CategoryModel, ItemModel], user: UserPrincipalSchema) -> None:
+    if resource.user_id != user.id:
+        raise ForbiddenException("User does not have permission to perform this action")
+
+
 def require_ownership(require_resource_dependency: Callable) -> Callable:
     def verify_ownership(
-        user: UserModel = Depends(require_authenticated_user),
+        user: UserPrincipalSchema = Depends(require_authenticated_user),
         resource: Union[CategoryModel, ItemModel] = Depends(require_resource_dependency),
     ) -> Union[CategoryModel, ItemModel]:
-        if resource.user_id != user.id:
-            raise ForbiddenException("User does not have permission to perform this action")
+        ensure_ownership(resource, user)
         return resource
 
     return verify_ownership
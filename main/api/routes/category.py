@@ -1,7 +1,8 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from main.api.dependencies.auth import require_authenticated_user, require_ownership
@@ -9,20 +10,41 @@ from main.api.dependencies.category import require_category
 from main.api.dependencies.database import get_database_session
 from main.api.exception import BadRequestException
 from main.models.category import CategoryModel
-from main.models.user import UserModel
 from main.schemas.category import (
     CategoryBatchResponseSchema,
     CategoryCreationRequestSchema,
     CategoryResponseSchema,
 )
+from main.schemas.user import UserPrincipalSchema
 from main.services import category as category_service
+from main.services.session import is_duplicate_entry_error
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def generate_ndjson_categories(categories: AsyncIterator) -> AsyncIterator[str]:
+    async for category in categories:
+        yield CategoryBatchResponseSchema.from_orm(category).json() + "\n"
+
 
 @router.get("", response_model=List[CategoryBatchResponseSchema], status_code=status.HTTP_200_OK)
-async def get_all_categories(session: AsyncSession = Depends(get_database_session)):
-    categories = await category_service.get_categories(session)
+async def get_all_categories(
+    request: Request,
+    page: int = Query(1, gt=0),
+    categories_per_page: Optional[int] = Query(None, gt=0),
+    session: AsyncSession = Depends(get_database_session),
+):
+    # Without categories_per_page, every category is returned as before
+    offset = (page - 1) * categories_per_page if categories_per_page else 0
+
+    # Clients asking for NDJSON get one category per line, streamed while rows are read
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        categories = category_service.stream_categories(session, limit=categories_per_page, offset=offset)
+        return StreamingResponse(generate_ndjson_categories(categories), media_type=NDJSON_MEDIA_TYPE)
+
+    categories = await category_service.get_categories(session, limit=categories_per_page, offset=offset)
     return categories
 
 
@@ -35,17 +57,19 @@ async def get_single_category(category: CategoryResponseSchema = Depends(require
 async def create_category(
     create_category_data: CategoryCreationRequestSchema,
     session: AsyncSession = Depends(get_database_session),
-    user: UserModel = Depends(require_authenticated_user),
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
 ):
-    category = await category_service.get_category_by_name(session, create_category_data.name)
-    if category:
+    try:
+        category = await category_service.create_category(
+            session=session,
+            name=create_category_data.name,
+            description=create_category_data.description,
+            user_id=user.id,
+        )
+    except IntegrityError as error:
+        if not is_duplicate_entry_error(error):
+            raise
         raise BadRequestException("Category already exists")
-    category = await category_service.create_category(
-        session=session,
-        name=create_category_data.name,
-        description=create_category_data.description,
-        user_id=user.id,
-    )
     return JSONResponse(content={"id": category.id}, status_code=status.HTTP_201_CREATED)
 
 
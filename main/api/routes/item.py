@@ -1,24 +1,35 @@
-from typing import Dict
+from typing import Dict, List, Optional, Set
 
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from main.api.dependencies.auth import require_authenticated_user, require_ownership
+from main.api.dependencies.auth import (
+    ensure_ownership,
+    require_authenticated_user,
+    require_ownership,
+)
 from main.api.dependencies.category import require_category
 from main.api.dependencies.database import get_database_session
 from main.api.dependencies.item import require_item
-from main.api.exception import BadRequestException
+from main.api.exception import BadRequestException, NotFoundException
 from main.models.category import CategoryModel
 from main.models.item import ItemModel
-from main.models.user import UserModel
 from main.schemas.item import (
+    ItemBatchCreationRequestSchema,
+    ItemBatchCreationResponseSchema,
     ItemBatchResponseSchema,
+    ItemBatchUpdateRequestSchema,
     ItemCreationRequestSchema,
     ItemResponseSchema,
     ItemUpdateRequestSchema,
 )
+from main.schemas.user import UserPrincipalSchema
+from main.services import category as category_service
 from main.services import item as item_service
+from main.services.pagination import decode_cursor, encode_cursor
+from main.services.session import is_duplicate_entry_error
 
 router = APIRouter()
 
@@ -28,19 +39,107 @@ async def create_item(
     create_item_data: ItemCreationRequestSchema,
     session: AsyncSession = Depends(get_database_session),
     category: CategoryModel = Depends(require_category),
-    user: UserModel = Depends(require_authenticated_user),
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
 ):
-    item = await item_service.get_item_by_name(session, create_item_data.name)
-    if item:
+    try:
+        item = await item_service.create_item(
+            session=session,
+            name=create_item_data.name,
+            description=create_item_data.description,
+            category_id=category.id,
+            user_id=user.id,
+        )
+    except IntegrityError as error:
+        if not is_duplicate_entry_error(error):
+            raise
         raise BadRequestException("Item already exists")
-    item = await item_service.create_item(
+    return JSONResponse(content={"id": item.id}, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/batch", response_model=ItemBatchCreationResponseSchema)
+async def create_items(
+    create_items_data: ItemBatchCreationRequestSchema,
+    session: AsyncSession = Depends(get_database_session),
+    category: CategoryModel = Depends(require_category),
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
+):
+    try:
+        created_items, duplicate_indexes = await item_service.create_items(
+            session=session,
+            items_data=[item_data.dict() for item_data in create_items_data.items],
+            category_id=category.id,
+            user_id=user.id,
+        )
+    except IntegrityError as error:
+        # Another request took one of the names after they were checked
+        if not is_duplicate_entry_error(error):
+            raise
+        raise BadRequestException("Item already exists")
+    response = ItemBatchCreationResponseSchema(
+        items=created_items,
+        errors=[
+            {"index": index, "name": create_items_data.items[index].name, "error_message": "Item already exists"}
+            for index in duplicate_indexes
+        ],
+    )
+    return JSONResponse(content=response.dict(), status_code=status.HTTP_201_CREATED)
+
+
+async def ensure_items_are_accessible(
+    session: AsyncSession,
+    category_id: int,
+    item_ids: Set[int],
+    user: UserPrincipalSchema,
+) -> None:
+    # Only called after a batch statement matched fewer items than requested, to find out why
+    category = await category_service.get_category_by_id(session, category_id)
+    if category is None:
+        raise NotFoundException("Cannot find the specified category")
+
+    items = await item_service.get_items_by_ids(session, category_id, item_ids)
+    if len(items) != len(item_ids):
+        raise NotFoundException("Cannot find the specified item")
+
+    for item in items:
+        ensure_ownership(item, user)
+
+
+@router.put("/batch")
+async def update_items(
+    category_id: int,
+    update_items_data: ItemBatchUpdateRequestSchema,
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
+    session: AsyncSession = Depends(get_database_session),
+):
+    descriptions = {item_data.id: item_data.description for item_data in update_items_data.items}
+    is_updated = await item_service.update_items(
         session=session,
-        name=create_item_data.name,
-        description=create_item_data.description,
-        category_id=category.id,
+        descriptions=descriptions,
+        category_id=category_id,
         user_id=user.id,
     )
-    return JSONResponse(content={"id": item.id}, status_code=status.HTTP_201_CREATED)
+    if not is_updated:
+        await ensure_items_are_accessible(session, category_id, set(descriptions), user)
+    return JSONResponse(content={}, status_code=status.HTTP_200_OK)
+
+
+@router.delete("/batch")
+async def delete_items(
+    category_id: int,
+    ids: List[int] = Query(..., min_items=1, max_items=1000),
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
+    session: AsyncSession = Depends(get_database_session),
+):
+    item_ids = set(ids)
+    is_deleted = await item_service.delete_items(
+        session=session,
+        item_ids=item_ids,
+        category_id=category_id,
+        user_id=user.id,
+    )
+    if not is_deleted:
+        await ensure_items_are_accessible(session, category_id, item_ids, user)
+    return JSONResponse(content={}, status_code=status.HTTP_200_OK)
 
 
 @router.get("/{item_id}", response_model=ItemResponseSchema)
@@ -52,31 +151,54 @@ async def get_single_item(item: ItemModel = Depends(require_item)):
 async def get_multiples_items(
     page: int = Query(1, gt=0),
     items_per_page: int = Query(20, gt=0),
+    after: Optional[str] = Query(None, min_length=1),
     category: CategoryModel = Depends(require_category),
     session: AsyncSession = Depends(get_database_session),
 ):
+    # When a cursor is given, it takes precedence over the page number
+    after_id = None
+    if after is not None:
+        try:
+            after_id = decode_cursor(after)
+        except ValueError:
+            raise BadRequestException("after: invalid cursor")
+
     offset = (page - 1) * items_per_page
     items = await item_service.get_items(
         session=session,
         category_id=category.id,
         limit=items_per_page,
         offset=offset,
+        after_id=after_id,
     )
-    total_number_of_items = await item_service.get_total_number_of_items_of_category(session, category.id)
+    next_cursor = encode_cursor(items[-1].id) if len(items) == items_per_page else None
     return ItemBatchResponseSchema(
-        total_number_of_items=total_number_of_items,
+        total_number_of_items=category.number_of_items,
         items_per_page=items_per_page,
         items=items,
+        next_cursor=next_cursor,
     )
 
 
 @router.put("/{item_id}")
 async def update_item(
+    category_id: int,
+    item_id: int,
     item_update_data: ItemUpdateRequestSchema,
-    item: ItemModel = Depends(require_ownership(require_item)),
+    user: UserPrincipalSchema = Depends(require_authenticated_user),
     session: AsyncSession = Depends(get_database_session),
 ):
-    await item_service.update_item(session, item.id, item_update_data.description)
+    is_updated = await item_service.update_item(
+        session=session,
+        item_id=item_id,
+        category_id=category_id,
+        user_id=user.id,
+        description=item_update_data.description,
+    )
+    if not is_updated:
+        # Nothing matched, look the item up only now to tell a missing item from someone else's
+        item = await require_item(category_id, item_id, session)
+        ensure_ownership(item, user)
     return JSONResponse(content={}, status_code=status.HTTP_200_OK)
 
 
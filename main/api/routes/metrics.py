@@ -0,0 +1,13 @@
+from fastapi import APIRouter, status
+
+from main.services import session
+from main.services.session import get_pool_statistics
+
+router = APIRouter()
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def get_metrics():
+    return {
+        "database_pool": get_pool_statistics(session.engine.sync_engine),
+    }
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from main.api.dependencies.database import get_database_session
@@ -8,9 +9,10 @@ from main.schemas.auth import AccessToken
 from main.schemas.user import UserAuthenticationRequestSchema, UserCreationRequestSchema
 from main.services.auth import (
     create_access_token,
-    generate_hashed_password,
-    verify_password,
+    generate_hashed_password_in_pool,
+    verify_password_in_pool,
 )
+from main.services.session import is_duplicate_entry_error
 from main.services.user import create_user, get_user_by_email
 
 router = APIRouter()
@@ -18,16 +20,18 @@ router = APIRouter()
 
 @router.post("")
 async def register(create_user_data: UserCreationRequestSchema, session: AsyncSession = Depends(get_database_session)):
-    user = await get_user_by_email(session, create_user_data.email)
-    if user:
+    hashed_password = await generate_hashed_password_in_pool(create_user_data.password)
+    try:
+        await create_user(
+            session=session,
+            email=create_user_data.email,
+            hashed_password=hashed_password,
+            full_name=create_user_data.full_name,
+        )
+    except IntegrityError as error:
+        if not is_duplicate_entry_error(error):
+            raise
         raise BadRequestException("This email is already registered")
-    hashed_password = generate_hashed_password(create_user_data.password)
-    await create_user(
-        session=session,
-        email=create_user_data.email,
-        hashed_password=hashed_password,
-        full_name=create_user_data.full_name,
-    )
     return JSONResponse(content={}, status_code=status.HTTP_201_CREATED)
 
 
@@ -40,7 +44,7 @@ async def authenticate(
     if user is None:
         raise UnauthorizedException("Invalid email or password")
 
-    if not verify_password(user_authentication_data.password, user.hashed_password):
+    if not await verify_password_in_pool(user_authentication_data.password, user.hashed_password):
         raise UnauthorizedException("Invalid email or password")
 
     access_token = create_access_token(user.id)
@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+
+from main.services import category as category_service
+from main.services.session import SessionLocal, engine
+
+
+async def recount_items(arguments: argparse.Namespace) -> None:
+    async with SessionLocal() as session:
+        await category_service.recount_items_of_categories(session, arguments.category_id)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m main.cli", description="Catalog maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    recount_items_parser = subparsers.add_parser(
+        "recount-items",
+        help="Recompute the maintained number of items of categories from the item table",
+    )
+    recount_items_parser.add_argument("--category-id", type=int, help="Only recount this category")
+    recount_items_parser.set_defaults(handler=recount_items)
+
+    return parser.parse_args()
+
+
+async def run(arguments: argparse.Namespace) -> None:
+    try:
+        await arguments.handler(arguments)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_arguments()))
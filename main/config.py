@@ -10,12 +10,25 @@ class Settings(BaseSettings):
 
     # Database config
     SQL_ALCHEMY_DATABASE_URL: str
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30
+    DATABASE_POOL_RECYCLE_SECONDS: int = -1  # Never recycle, set below the server's wait_timeout when needed
+    DATABASE_POOL_PRE_PING: bool = False
 
     # Security config
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_EXPIRED_MINUTES: int
 
+    # Password hashing config, a pool size of 0 hashes in the default thread pool instead of processes
+    PASSWORD_HASHING_POOL_SIZE: int = 2
+    PASSWORD_HASHING_MAX_PENDING: int = 64
+
+    # Authenticated user cache config, a max size of 0 disables the cache
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+
     class Config:
         env_file = f"{environment}.env"
 
@@ -5,6 +5,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from main.api.routes.router import api_router
 from main.services import session
+from main.services.auth import shutdown_password_hashing_executor
 
 app = FastAPI()
 
@@ -16,6 +17,11 @@ async def create_table():
     await session.create_table()
 
 
+@app.on_event("shutdown")
+async def stop_password_hashing():
+    shutdown_password_hashing_executor()
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
     error_message = ""
@@ -10,6 +10,8 @@ class CategoryModel(Base):
     name = Column(CHAR(length=50), unique=True, nullable=False)
     description = Column(Text(length=5000))
     user_id = Column(Integer, ForeignKey("user.id"))
+    # Maintained by the item service so listings don't need to count rows
+    number_of_items = Column(Integer, nullable=False, default=0, server_default="0")
 
     user = relationship("UserModel")
     items = relationship("ItemModel", back_populates="category", cascade="all, delete")
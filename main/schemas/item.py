@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from pydantic import constr
+from pydantic import conlist, constr
 
 from main.schemas.base import BaseSchema
 
@@ -17,10 +17,22 @@ class ItemCreationRequestSchema(ItemSchema):
     pass
 
 
+class ItemBatchCreationRequestSchema(BaseSchema):
+    items: conlist(ItemCreationRequestSchema, min_items=1, max_items=1000)
+
+
 class ItemUpdateRequestSchema(ItemBaseSchema):
     pass
 
 
+class ItemBatchUpdateEntrySchema(ItemBaseSchema):
+    id: int
+
+
+class ItemBatchUpdateRequestSchema(BaseSchema):
+    items: conlist(ItemBatchUpdateEntrySchema, min_items=1, max_items=1000)
+
+
 class ItemResponseSchema(ItemSchema):
     pass
 
@@ -29,3 +41,20 @@ class ItemBatchResponseSchema(BaseSchema):
     total_number_of_items: int
     items_per_page: int = 20
     items: List[ItemResponseSchema]
+    next_cursor: Optional[str] = None
+
+
+class ItemCreationResultSchema(BaseSchema):
+    id: int
+    name: str
+
+
+class ItemCreationErrorSchema(BaseSchema):
+    index: int
+    name: str
+    error_message: str
+
+
+class ItemBatchCreationResponseSchema(BaseSchema):
+    items: List[ItemCreationResultSchema]
+    errors: List[ItemCreationErrorSchema]
@@ -32,3 +32,13 @@ class UserAuthenticationRequestSchema(BaseSchema):
 
 class UserCreationRequestSchema(UserAuthenticationRequestSchema):
     full_name: constr(min_length=1, max_length=50)
+
+
+class UserPrincipalSchema(BaseSchema):
+    id: int
+    email: str
+    full_name: str
+
+    class Config:
+        # Instances are shared between requests through the user cache
+        allow_mutation = False
@@ -1,4 +1,8 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
 
 import jwt
 from passlib.context import CryptContext
@@ -16,6 +20,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return password_context.verify(plain_password, hashed_password)
 
 
+password_hashing_executor: Optional[ProcessPoolExecutor] = None
+password_hashing_semaphore: Optional[asyncio.Semaphore] = None
+
+
+async def run_password_hashing(function: Callable, *arguments: Any) -> Any:
+    global password_hashing_executor, password_hashing_semaphore
+
+    # Created lazily so they are bound to the running event loop and only started when needed
+    if password_hashing_semaphore is None:
+        password_hashing_semaphore = asyncio.Semaphore(settings.PASSWORD_HASHING_MAX_PENDING)
+    if password_hashing_executor is None and settings.PASSWORD_HASHING_POOL_SIZE > 0:
+        password_hashing_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASHING_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    # Bcrypt is CPU bound, callers wait here instead of piling work onto the pool
+    async with password_hashing_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_hashing_executor, function, *arguments)
+
+
+async def generate_hashed_password_in_pool(password: str) -> str:
+    return await run_password_hashing(generate_hashed_password, password)
+
+
+async def verify_password_in_pool(plain_password: str, hashed_password: str) -> bool:
+    return await run_password_hashing(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_hashing_executor() -> None:
+    global password_hashing_executor, password_hashing_semaphore
+
+    if password_hashing_executor is not None:
+        password_hashing_executor.shutdown()
+    password_hashing_executor = None
+    password_hashing_semaphore = None
+
+
 def create_access_token(user_id: int) -> str:
     now = datetime.utcnow()
     expired_time = now + timedelta(minutes=settings.JWT_EXPIRED_MINUTES)
@@ -1,9 +1,13 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from main.models.category import CategoryModel
+from main.models.item import ItemModel
 
 
 async def get_category_by_id(session: AsyncSession, category_id: int) -> Optional[CategoryModel]:
@@ -18,13 +22,31 @@ async def get_category_by_name(session: AsyncSession, name: str) -> Optional[Cat
     return category
 
 
-async def get_categories(session: AsyncSession) -> List[CategoryModel]:
-    statement = select(CategoryModel)
+# Number of rows fetched from the database cursor at a time when streaming
+STREAM_CHUNK_SIZE = 1000
+
+
+def _paginate_categories(statement: Select, limit: Optional[int], offset: int) -> Select:
+    statement = statement.order_by(CategoryModel.id).limit(limit)
+    if offset:
+        statement = statement.offset(offset)
+    return statement
+
+
+async def get_categories(session: AsyncSession, limit: Optional[int] = None, offset: int = 0) -> List[CategoryModel]:
+    statement = _paginate_categories(select(CategoryModel), limit, offset)
     result = await session.execute(statement)
     categories = result.scalars().all()
     return categories
 
 
+async def stream_categories(session: AsyncSession, limit: Optional[int] = None, offset: int = 0) -> AsyncIterator[Row]:
+    statement = _paginate_categories(select(CategoryModel.id, CategoryModel.name), limit, offset)
+    result = await session.stream(statement.execution_options(yield_per=STREAM_CHUNK_SIZE))
+    async for category in result:
+        yield category
+
+
 async def create_category(session: AsyncSession, name: str, description: str, user_id: int) -> CategoryModel:
     category = CategoryModel(
         name=name,
@@ -32,7 +54,11 @@ async def create_category(session: AsyncSession, name: str, description: str, us
         user_id=user_id,
     )
     session.add(category)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise
     await session.refresh(category)
     return category
 
@@ -41,3 +67,17 @@ async def delete_category(session: AsyncSession, category_id: int) -> None:
     category = await session.get(CategoryModel, category_id)
     await session.delete(category)
     await session.commit()
+
+
+async def recount_items_of_categories(session: AsyncSession, category_id: Optional[int] = None) -> None:
+    number_of_items = (
+        select(func.count())
+        .select_from(ItemModel)
+        .where(ItemModel.category_id == CategoryModel.id)
+        .scalar_subquery()
+    )
+    statement = update(CategoryModel).values(number_of_items=number_of_items)
+    if category_id is not None:
+        statement = statement.where(CategoryModel.id == category_id)
+    await session.execute(statement.execution_options(synchronize_session=False))
+    await session.commit()
@@ -1,8 +1,11 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import func, select, update
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from main.models.category import CategoryModel
 from main.models.item import ItemModel
 
 
@@ -11,6 +14,25 @@ async def get_item_by_id(session: AsyncSession, item_id: int) -> Optional[ItemMo
     return item
 
 
+async def get_category_and_item(
+    session: AsyncSession,
+    category_id: int,
+    item_id: int,
+) -> Tuple[Optional[CategoryModel], Optional[ItemModel]]:
+    # The item is outer joined, so a missing category and a missing item can be told apart in one query
+    statement = (
+        select(CategoryModel, ItemModel)
+        .outerjoin(ItemModel, and_(ItemModel.category_id == CategoryModel.id, ItemModel.id == item_id))
+        .where(CategoryModel.id == category_id)
+    )
+    result = await session.execute(statement)
+    row = result.one_or_none()
+    if row is None:
+        return None, None
+    category, item = row
+    return category, item
+
+
 async def get_item_by_name(session: AsyncSession, name: str) -> Optional[ItemModel]:
     statement = select(ItemModel).where(ItemModel.name == name)
     result = await session.execute(statement)
@@ -30,15 +52,26 @@ async def get_total_number_of_items_of_category(session: AsyncSession, category_
     return total_number_of_items
 
 
-async def get_items(session: AsyncSession, category_id: int, limit: int, offset: int) -> List[ItemModel]:
+async def get_items(
+    session: AsyncSession,
+    category_id: int,
+    limit: int,
+    offset: int = 0,
+    after_id: Optional[int] = None,
+) -> List[ItemModel]:
     statement = (
         select(ItemModel)
         .where(
             ItemModel.category_id == category_id,
         )
-        .offset(offset)
+        .order_by(ItemModel.id)
         .limit(limit)
     )
+    if after_id is not None:
+        # Seek past the last seen item so deep pages cost the same as the first one
+        statement = statement.where(ItemModel.id > after_id)
+    else:
+        statement = statement.offset(offset)
     result = await session.execute(statement)
     items = result.scalars().all()
     return items
@@ -58,24 +91,148 @@ async def create_item(
         user_id=user_id,
     )
     session.add(item)
+    try:
+        await session.flush()
+    except IntegrityError:
+        await session.rollback()
+        raise
+    await _change_number_of_items_of_category(session, category_id, 1)
     await session.commit()
     await session.refresh(item)
     return item
 
 
-async def update_item(session: AsyncSession, item_id: int, description: str) -> None:
-    item = await session.get(ItemModel, item_id)
+async def create_items(
+    session: AsyncSession,
+    items_data: List[dict],
+    category_id: int,
+    user_id: int,
+) -> Tuple[List[Row], List[int]]:
+    # Returns the id and name of created items and the indexes of items whose name is already taken
+    names = [item_data["name"] for item_data in items_data]
+    result = await session.execute(select(ItemModel.name).where(ItemModel.name.in_(names)))
+    taken_names = set(result.scalars().all())
+
+    new_items = []
+    duplicate_indexes = []
+    for index, item_data in enumerate(items_data):
+        if item_data["name"] in taken_names:
+            duplicate_indexes.append(index)
+            continue
+        taken_names.add(item_data["name"])
+        new_items.append({**item_data, "category_id": category_id, "user_id": user_id})
+    if not new_items:
+        return [], duplicate_indexes
+
+    try:
+        # A list of parameters makes this a single executemany
+        await session.execute(insert(ItemModel), new_items)
+    except IntegrityError:
+        await session.rollback()
+        raise
+    await _change_number_of_items_of_category(session, category_id, len(new_items))
+    statement = (
+        select(ItemModel.id, ItemModel.name)
+        .where(ItemModel.name.in_([item["name"] for item in new_items]))
+        .order_by(ItemModel.id)
+    )
+    result = await session.execute(statement)
+    created_items = result.all()
+    await session.commit()
+    return created_items, duplicate_indexes
+
+
+async def update_item(
+    session: AsyncSession,
+    item_id: int,
+    category_id: int,
+    user_id: int,
+    description: str,
+) -> bool:
+    # Only updates the item when it belongs to the category and the user, returns whether it did
     statement = (
         update(ItemModel)
-        .where(ItemModel.id == item.id)
+        .where(
+            ItemModel.id == item_id,
+            ItemModel.category_id == category_id,
+            ItemModel.user_id == user_id,
+        )
         .values(description=description)
-        .execution_options(synchronize_session="evaluate")
+        .execution_options(synchronize_session=False)
     )
-    await session.execute(statement)
+    result = await session.execute(statement)
+    await session.commit()
+    return result.rowcount > 0
+
+
+async def get_items_by_ids(session: AsyncSession, category_id: int, item_ids: Set[int]) -> List[Row]:
+    statement = select(ItemModel.id, ItemModel.user_id).where(
+        ItemModel.category_id == category_id,
+        ItemModel.id.in_(item_ids),
+    )
+    result = await session.execute(statement)
+    items = result.all()
+    return items
+
+
+async def update_items(
+    session: AsyncSession,
+    descriptions: Dict[int, str],
+    category_id: int,
+    user_id: int,
+) -> bool:
+    # Updates all items in one statement, or none of them unless they all belong to the category and the user
+    statement = (
+        update(ItemModel)
+        .where(
+            ItemModel.id.in_(descriptions.keys()),
+            ItemModel.category_id == category_id,
+            ItemModel.user_id == user_id,
+        )
+        .values(description=case(descriptions, value=ItemModel.id))
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    if result.rowcount != len(descriptions):
+        await session.rollback()
+        return False
     await session.commit()
+    return True
+
+
+async def delete_items(session: AsyncSession, item_ids: Set[int], category_id: int, user_id: int) -> bool:
+    # Deletes all items in one statement, or none of them unless they all belong to the category and the user
+    statement = (
+        delete(ItemModel)
+        .where(
+            ItemModel.id.in_(item_ids),
+            ItemModel.category_id == category_id,
+            ItemModel.user_id == user_id,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    if result.rowcount != len(item_ids):
+        await session.rollback()
+        return False
+    await _change_number_of_items_of_category(session, category_id, -len(item_ids))
+    await session.commit()
+    return True
 
 
 async def delete_item(session: AsyncSession, item_id: int) -> None:
     item = await session.get(ItemModel, item_id)
     await session.delete(item)
+    await session.flush()
+    await _change_number_of_items_of_category(session, item.category_id, -1)
     await session.commit()
+
+
+async def _change_number_of_items_of_category(session: AsyncSession, category_id: int, difference: int) -> None:
+    statement = (
+        update(CategoryModel)
+        .where(CategoryModel.id == category_id)
+        .values(number_of_items=CategoryModel.number_of_items + difference)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(statement)
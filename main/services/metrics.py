@@ -0,0 +1,27 @@
+import bisect
+from typing import List, Sequence
+
+# Upper bounds in seconds, suitable for latencies from a millisecond to several seconds
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets: List[float] = sorted(buckets)
+        self.bucket_counts: List[int] = [0] * (len(self.buckets) + 1)  # Last one counts values above every bound
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        # Cumulative counts per upper bound, in the same shape as Prometheus histograms
+        cumulative_counts = {}
+        total = 0
+        for bound, bucket_count in zip(self.buckets + ["+Inf"], self.bucket_counts):
+            total += bucket_count
+            cumulative_counts[str(bound)] = total
+        return {"buckets": cumulative_counts, "count": self.count, "sum": self.sum}
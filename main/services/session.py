@@ -1,12 +1,77 @@
+import time
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from main.config import settings
 from main.models.base import Base
+from main.services.metrics import Histogram
+
+
+class PoolStatistics:
+    def __init__(self):
+        self.checkout_wait_seconds = Histogram()
+        self.timeouts = 0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.statistics.timeouts += 1
+            raise
+        finally:
+            self.statistics.checkout_wait_seconds.observe(time.perf_counter() - started)
+
+    def recreate(self):
+        # Keep the statistics when the engine is disposed
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
 
-engine = create_async_engine(settings.SQL_ALCHEMY_DATABASE_URL, future=True)
+
+engine = create_async_engine(
+    settings.SQL_ALCHEMY_DATABASE_URL,
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
 
+MYSQL_DUPLICATE_ENTRY_ERROR_CODE = 1062
+
+
+def is_duplicate_entry_error(error: IntegrityError) -> bool:
+    if engine.dialect.name == "mysql":
+        return error.orig.args[0] == MYSQL_DUPLICATE_ENTRY_ERROR_CODE
+    return "UNIQUE constraint failed" in str(error.orig)
+
+
+def get_pool_statistics(sync_engine: Engine) -> dict:
+    pool = sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeouts": pool.statistics.timeouts,
+        "checkout_wait_seconds": pool.statistics.checkout_wait_seconds.to_dict(),
+    }
+
 
 async def create_table():
     async with engine.begin() as connection:
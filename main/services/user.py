@@ -1,9 +1,15 @@
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from main.config import settings
 from main.models.user import UserModel
+from main.schemas.user import UserPrincipalSchema
+from main.services.cache import TTLCache
+
+user_cache = TTLCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
 
 
 async def get_user_by_id(session: AsyncSession, user_id: int) -> Optional[UserModel]:
@@ -11,6 +17,21 @@ async def get_user_by_id(session: AsyncSession, user_id: int) -> Optional[UserMo
     return user
 
 
+async def get_user_principal_by_id(session: AsyncSession, user_id: int) -> Optional[UserPrincipalSchema]:
+    user_principal = user_cache.get(user_id)
+    if user_principal is None:
+        user = await get_user_by_id(session, user_id)
+        if user is None:
+            return None
+        user_principal = UserPrincipalSchema.from_orm(user)
+        user_cache.set(user_id, user_principal)
+    return user_principal
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    user_cache.delete(user_id)
+
+
 async def get_user_by_email(session: AsyncSession, email: str) -> Optional[UserModel]:
     statement = select(UserModel).where(UserModel.email == email)
     result = await session.execute(statement)
@@ -25,5 +46,12 @@ async def create_user(session: AsyncSession, email: str, hashed_password: str, f
         full_name=full_name,
     )
     session.add(user)
+    try:
+        await session.flush()
+    except IntegrityError:
+        await session.rollback()
+        raise
+    # The id may have belonged to a user that was removed
+    invalidate_cached_user(user.id)
     await session.commit()
     return user
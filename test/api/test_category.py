@@ -1,3 +1,4 @@
+import json
 from test.helpers import generate_authorization_header
 from typing import Union
 
@@ -166,6 +167,50 @@ async def test_get_categories_successfully(client: AsyncClient, access_token: st
     ]
 
 
+@pytest.mark.parametrize(
+    "page, categories_per_page, expected_category_ids",
+    [
+        (1, 2, [1, 2]),
+        (2, 2, [3, 4]),
+        (3, 2, [5]),
+        (4, 2, []),
+    ],
+)
+async def test_get_categories_with_pagination_successfully(
+    client: AsyncClient,
+    access_token: str,
+    page: int,
+    categories_per_page: int,
+    expected_category_ids: list,
+):
+    for name_postfix in range(5):
+        await client.post(
+            "/categories",
+            headers=generate_authorization_header(access_token),
+            json={"name": "Car " + str(name_postfix), "description": "Car has 4 wheels"},
+        )
+    response = await client.get(f"/categories?page={page}&categories_per_page={categories_per_page}")
+    assert response.status_code == status.HTTP_200_OK
+    assert [category["id"] for category in response.json()] == expected_category_ids
+
+
+async def test_stream_categories_successfully(client: AsyncClient, access_token: str):
+    for name_postfix in range(3):
+        await client.post(
+            "/categories",
+            headers=generate_authorization_header(access_token),
+            json={"name": "Car " + str(name_postfix), "description": "Car has 4 wheels"},
+        )
+    response = await client.get("/categories", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"id": 1, "name": "Car 0"},
+        {"id": 2, "name": "Car 1"},
+        {"id": 3, "name": "Car 2"},
+    ]
+
+
 @pytest.mark.parametrize(
     "category_id, expected_status_code, expected_json_response",
     [
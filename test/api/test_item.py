@@ -4,6 +4,11 @@ from typing import Union
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import update
+
+from main.models.category import CategoryModel
+from main.services import category as category_service
+from main.services import session
 
 
 async def test_fail_to_create_item_without_authentication(client: AsyncClient, item_creation: None):
@@ -156,6 +161,68 @@ async def test_create_item_successfully(
     }
 
 
+async def test_create_items_in_batch_successfully(
+    client: AsyncClient,
+    access_token: str,
+    item_creation: None,
+):
+    response = await client.post(
+        "/categories/1/items/batch",
+        headers=generate_authorization_header(access_token),
+        json={
+            "items": [
+                {"name": "Audi", "description": "Audi from Germany"},
+                {"name": "Volvo", "description": "Volvo from Sweden"},
+                {"name": "Honda", "description": "Honda from Japan"},
+                {"name": "Audi", "description": "Another Audi"},
+            ]
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {
+        "items": [{"id": 2, "name": "Audi"}, {"id": 3, "name": "Honda"}],
+        "errors": [
+            {"index": 1, "name": "Volvo", "error_message": "Item already exists"},
+            {"index": 3, "name": "Audi", "error_message": "Item already exists"},
+        ],
+    }
+
+    response = await client.get("/categories/1/items")
+    assert response.json()["total_number_of_items"] == 3
+    assert response.json()["items"][1] == {"name": "Audi", "description": "Audi from Germany"}
+
+
+@pytest.mark.parametrize(
+    "items_data, expected_json_response",
+    [
+        # Batch is empty
+        (
+            {"items": []},
+            {"error_message": "items: ensure this value has at least 1 items"},
+        ),
+        # Batch is too large
+        (
+            {"items": [{"name": "Volvo" + str(index), "description": "Volvo"} for index in range(1001)]},
+            {"error_message": "items: ensure this value has at most 1000 items"},
+        ),
+    ],
+)
+async def test_fail_to_create_items_in_batch_with_invalid_size(
+    client: AsyncClient,
+    access_token: str,
+    category_creation: None,
+    items_data: dict,
+    expected_json_response: dict,
+):
+    response = await client.post(
+        "/categories/1/items/batch",
+        headers=generate_authorization_header(access_token),
+        json=items_data,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == expected_json_response
+
+
 @pytest.mark.parametrize(
     "page, items_per_page, expected_json_response",
     [
@@ -230,6 +297,43 @@ async def test_get_items_successfully_without_query_parameters(client: AsyncClie
     assert items_data["items_per_page"] == 20
 
 
+async def test_get_items_with_cursor_successfully(client: AsyncClient, list_items_creation: None):
+    response = await client.get("/categories/1/items?items_per_page=12")
+    items_data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    item_names = [item["name"] for item in items_data["items"]]
+
+    # Follow the cursors until the last page
+    while items_data["next_cursor"] is not None:
+        response = await client.get(f"/categories/1/items?items_per_page=12&after={items_data['next_cursor']}")
+        items_data = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert items_data["total_number_of_items"] == 30
+        item_names += [item["name"] for item in items_data["items"]]
+
+    assert item_names == ["Volvo" + str(name_postfix) for name_postfix in range(30)]
+
+
+async def test_number_of_items_is_maintained(client: AsyncClient, access_token: str, list_items_creation: None):
+    await client.delete("/categories/1/items/1", headers=generate_authorization_header(access_token))
+    response = await client.get("/categories/1/items")
+    assert response.json()["total_number_of_items"] == 29
+
+    # Corrupt the counter, then repair it from the item table
+    async with session.SessionLocal() as database_session:
+        await database_session.execute(update(CategoryModel).values(number_of_items=0))
+        await database_session.commit()
+        await category_service.recount_items_of_categories(database_session)
+    response = await client.get("/categories/1/items")
+    assert response.json()["total_number_of_items"] == 29
+
+
+async def test_fail_to_get_items_with_invalid_cursor(client: AsyncClient, list_items_creation: None):
+    response = await client.get("/categories/1/items?after=not-a-cursor")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"error_message": "after: invalid cursor"}
+
+
 @pytest.mark.parametrize(
     "item_id, expected_status_code, expected_json_response",
     [
@@ -259,6 +363,27 @@ async def test_fail_to_get_single_item(
     assert response.json() == expected_json_response
 
 
+async def test_fail_to_get_single_item_of_other_category(
+    client: AsyncClient,
+    access_token: str,
+    item_creation: None,
+):
+    await client.post(
+        "/categories",
+        headers=generate_authorization_header(access_token),
+        json={"name": "Bike", "description": "Bike has 2 wheels"},
+    )
+    # Item 1 belongs to category 1
+    response = await client.get("/categories/2/items/1")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error_message": "Cannot find the specified item"}
+
+    # Category 3 does not exist
+    response = await client.get("/categories/3/items/1")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error_message": "Cannot find the specified category"}
+
+
 async def test_get_single_item_successfully(client: AsyncClient, item_creation: None):
     response = await client.get("/categories/1/items/1")
     assert response.status_code == status.HTTP_200_OK
@@ -341,6 +466,123 @@ async def test_update_item_successfully(
     assert response.json().get("description") == "new description"
 
 
+async def test_update_item_with_unchanged_description_successfully(
+    client: AsyncClient,
+    access_token: str,
+    item_creation: None,
+):
+    response = await client.put(
+        "/categories/1/items/1",
+        headers=generate_authorization_header(access_token),
+        json={"description": "Volvo from Germany"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {}
+
+
+async def test_fail_to_update_item_with_non_existent_category(
+    client: AsyncClient,
+    access_token: str,
+    item_creation: None,
+):
+    response = await client.put(
+        "/categories/10/items/1",
+        headers=generate_authorization_header(access_token),
+        json={"description": "new description"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error_message": "Cannot find the specified category"}
+
+
+async def test_update_items_in_batch_successfully(
+    client: AsyncClient,
+    access_token: str,
+    list_items_creation: None,
+):
+    response = await client.put(
+        "/categories/1/items/batch",
+        headers=generate_authorization_header(access_token),
+        json={"items": [{"id": 1, "description": "Volvo from Sweden"}, {"id": 2, "description": "Old Volvo"}]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {}
+
+    response = await client.get("/categories/1/items?items_per_page=3")
+    assert [item["description"] for item in response.json()["items"]] == [
+        "Volvo from Sweden",
+        "Old Volvo",
+        "Volvo from Germany",
+    ]
+
+
+async def test_delete_items_in_batch_successfully(
+    client: AsyncClient,
+    access_token: str,
+    list_items_creation: None,
+):
+    response = await client.delete(
+        "/categories/1/items/batch?ids=1&ids=2&ids=3",
+        headers=generate_authorization_header(access_token),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {}
+
+    response = await client.get("/categories/1/items?items_per_page=1")
+    assert response.json()["total_number_of_items"] == 27
+    assert response.json()["items"] == [{"name": "Volvo3", "description": "Volvo from Germany"}]
+
+
+@pytest.mark.parametrize(
+    "item_ids, expected_status_code, expected_json_response",
+    [
+        # One of the items does not exist
+        (
+            [1, 10],
+            status.HTTP_404_NOT_FOUND,
+            {"error_message": "Cannot find the specified item"},
+        ),
+        # One of the items belongs to the other user
+        (
+            [1, 2],
+            status.HTTP_403_FORBIDDEN,
+            {"error_message": "User does not have permission to perform this action"},
+        ),
+    ],
+)
+async def test_fail_to_change_items_in_batch(
+    client: AsyncClient,
+    access_token: str,
+    access_token_other_user: str,
+    item_creation: None,
+    item_ids: list,
+    expected_status_code: int,
+    expected_json_response: dict,
+):
+    await client.post(
+        "/categories/1/items",
+        headers=generate_authorization_header(access_token_other_user),
+        json={"name": "Audi", "description": "Audi from Germany"},
+    )
+    response = await client.put(
+        "/categories/1/items/batch",
+        headers=generate_authorization_header(access_token),
+        json={"items": [{"id": item_id, "description": "new description"} for item_id in item_ids]},
+    )
+    assert response.status_code == expected_status_code
+    assert response.json() == expected_json_response
+
+    response = await client.delete(
+        "/categories/1/items/batch?" + "&".join(f"ids={item_id}" for item_id in item_ids),
+        headers=generate_authorization_header(access_token),
+    )
+    assert response.status_code == expected_status_code
+    assert response.json() == expected_json_response
+
+    # Nothing is changed
+    response = await client.get("/categories/1/items/1")
+    assert response.json() == {"name": "Volvo", "description": "Volvo from Germany"}
+
+
 async def test_fail_to_delete_item_without_authentication(
     client: AsyncClient,
     access_token: str,
@@ -1,7 +1,12 @@
+import asyncio
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from main.services.auth import generate_hashed_password_in_pool, verify_password_in_pool
+from main.services.user import invalidate_cached_user, user_cache
+
 INVALID_EMAIL_CASES = [
     # Email has space
     (
@@ -298,3 +303,26 @@ async def test_login_successfully(client: AsyncClient):
     )
     assert response.status_code == status.HTTP_200_OK
     assert "access_token" in response.json()
+
+
+async def test_hash_passwords_concurrently_in_pool():
+    hashed_passwords = await asyncio.gather(
+        *[generate_hashed_password_in_pool("String" + str(index)) for index in range(4)],
+    )
+    for index, hashed_password in enumerate(hashed_passwords):
+        assert await verify_password_in_pool("String" + str(index), hashed_password)
+        assert not await verify_password_in_pool("Wrong" + str(index), hashed_password)
+
+
+async def test_authenticated_user_is_cached(client: AsyncClient, access_token: str):
+    assert user_cache.get(1) is None
+    response = await client.post(
+        "/categories",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"name": "Car", "description": "Car has 4 wheels"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert user_cache.get(1).email == "email@example.com"
+
+    invalidate_cached_user(1)
+    assert user_cache.get(1) is None
@@ -5,6 +5,7 @@ from httpx import AsyncClient
 
 from main.main import app
 from main.services import session
+from main.services.user import user_cache
 
 pytest_plugins = ["test.helpers"]
 
@@ -21,6 +22,7 @@ async def connection() -> None:
     async with session.engine.begin() as connection:
         await connection.run_sync(session.Base.metadata.drop_all)
         await connection.run_sync(session.Base.metadata.create_all)
+    user_cache.clear()
 
 
 @pytest.fixture